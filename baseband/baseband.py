@@ -34,19 +34,20 @@ I2C_ACCESS_COMMAND_SET_DEFAULT = bytearray([0x30, 0x06])  # <1> Set actual setti
 
 # Helper to convert enums to strings and vice versa. The enum classes have the same name as fields in the SETTINGS struct.
 SETTINGS_ENUMS = [VIDEO_MODE, VIDEO_IN, OSD_MODE, FM_BANDWIDTH, INPUT, INPUT_CH1, INPUT_CH2, PREEMPHASIS, NICAM_BANDWIDTH, AUDIO_NCO_MODE, AUDIO_NCO_WAVEFORM]
+SETTINGS_ENUMS_BY_FIELD = {enum.__name__.lower(): enum for enum in SETTINGS_ENUMS}
 
 
 def enumstring_to_int(field_name: str, value: str) -> Any:
     """
     Convert a string to the correct enum type if applicable, else assume int.
     """
-    for enum in SETTINGS_ENUMS:
-        if field_name == enum.__name__.lower():
-            try:
-                return enum[value].value
-            except KeyError:
-                raise ValueError(f'Invalid value {value} for {field_name}, must be one of {", ".join([e.name for e in enum])}')
-    return int(value)
+    enum = SETTINGS_ENUMS_BY_FIELD.get(field_name)
+    if enum is None:
+        return int(value)
+    try:
+        return enum[value].value
+    except KeyError:
+        raise ValueError(f'Invalid value {value} for {field_name}, must be one of {", ".join([e.name for e in enum])}')
 
 
 T = TypeVar('T', bound=Structure)
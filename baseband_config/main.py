@@ -14,9 +14,6 @@ except ImportError:
 import time
 from baseband.baseband import Baseband
 from baseband.settings import SETTINGS
-from baseband.usb_easymcp import UsbEasyMcp
-from baseband.usb_ftdi import UsbFtdi
-from baseband.usb_mcp2221 import UsbMcp2221
 
 
 GPIO_PULSE_LENGTH = 3  # Pulse length in seconds
@@ -28,20 +25,19 @@ def read_pattern_file(filename):
     format is <addr>: <data> ... <data> (20 bytes)
     0000: 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00
     '''
-    buffer = [0] * 8192
+    buffer = bytearray(8192)
     with open(filename, 'rt') as file:
-        for line in file.readlines():
-            line = line.rstrip('\n').rstrip('\r')
+        for line in file:
+            line = line.rstrip()
             # Check format
             if len(line) < 6 or line[4] != ':':
                 continue
             # Parse address
             address = int(line[:4], 16)
-            # Parse data
-            data = line[6:].split()
-            for byte in data:
-                buffer[address] = int(byte, 16)
-                address += 1
+            # Parse data, fromhex() skips the whitespace between the bytes
+            data = bytes.fromhex(line[5:])
+            assert address + len(data) <= len(buffer), f'Pattern data at {address:04x} exceeds pattern memory size'
+            buffer[address:address + len(data)] = data
     return buffer
 
 
@@ -81,11 +77,15 @@ def main():
     parser.add_argument('--program_pattern_memory', type=str, help='Program pattern memory from file contents')
     args = parser.parse_args()
 
+    # Import the USB drivers on demand, the MCP2221 libraries are optional dependencies
     if args.usb_mcp2221:
+        from baseband.usb_mcp2221 import UsbMcp2221
         usb_driver = UsbMcp2221()
     elif args.usb_easymcp:
+        from baseband.usb_easymcp import UsbEasyMcp
         usb_driver = UsbEasyMcp()
     else:
+        from baseband.usb_ftdi import UsbFtdi
         usb_driver = UsbFtdi(serial=args.serial, description=args.description)
     bb = Baseband(usb_driver)
 
@@ -230,7 +230,7 @@ def main():
     if args.program_pattern_memory:
         buffer = read_pattern_file(args.program_pattern_memory)
         if buffer:
-            bb.write_pattern_memory(bytes(buffer))
+            bb.write_pattern_memory(buffer)
             print('Pattern memory programmed')
             for address, data in enumerate(buffer):
                 if address % 32 == 0:
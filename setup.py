@@ -1,9 +1,9 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name='baseband_config',
     version='0.9',
-    packages=find_packages(),
+    packages=['baseband', 'baseband_config'],
     entry_points={
         'console_scripts': [
             'baseband_config = baseband_config.main:main',
@@ -18,5 +18,10 @@ setup(
         'Programming Language :: Python :: 3.9',
     ],
     keywords='baseband i2c usb control',
-    install_requires=['pyftdi', 'EasyMCP2221', 'PyMCP2221A'],
+    install_requires=['pyftdi'],
+    extras_require={
+        'easymcp': ['EasyMCP2221'],
+        'mcp2221a': ['PyMCP2221A'],
+        'all': ['EasyMCP2221', 'PyMCP2221A'],
+    },
 )
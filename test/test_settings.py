@@ -2,8 +2,24 @@
 Test all settings using the CLI
 """
 
-import os
+import shlex
 import unittest
+from subprocess import DEVNULL, run
+
+# Default FM settings, the channels only differ in frequency and input
+FM_COMMON_SETTINGS: dict = {
+    "rf_level": 100,
+    "generator_ena": 0,
+    "generator_level": 2,
+    "preemphasis": "AUDIO_50US",
+    "fm_bandwidth": "BW_130",
+    "am": 0,
+    "enable": 1
+}
+FM_CHANNEL_SETTINGS: list[dict] = [
+    dict(FM_COMMON_SETTINGS, rf_frequency_khz=frequency, input=fm_input)
+    for frequency, fm_input in [(7020, "ADC1L"), (7200, "ADC1R"), (7380, "ADC2L"), (7560, "ADC2R")]
+]
 
 
 class TestCliSettings(unittest.TestCase):
@@ -14,67 +30,16 @@ class TestCliSettings(unittest.TestCase):
         """
         Run a system command, return the exit code
         """
-        if os.name == 'nt':
-            return os.system(f"{cmd} > nul 2>&1")
-        else:
-            return os.system(f"{cmd} > /dev/null 2>&1")
+        return run(shlex.split(cmd), stdout=DEVNULL, stderr=DEVNULL).returncode
 
     def test_fm(self):
         """
         Test FM settings
         """
         # Go over FM channel 0..3, set all to default
-        settings: list[dict] = [
-        {
-            "rf_frequency_khz": 7020,
-            "rf_level": 100,
-            "input": "ADC1L",
-            "generator_ena": 0,
-            "generator_level": 2,
-            "preemphasis": "AUDIO_50US",
-            "fm_bandwidth": "BW_130",
-            "am": 0,
-            "enable": 1
-        },
-        {
-            "rf_frequency_khz": 7200,
-            "rf_level": 100,
-            "input": "ADC1R",
-            "generator_ena": 0,
-            "generator_level": 2,
-            "preemphasis": "AUDIO_50US",
-            "fm_bandwidth": "BW_130",
-            "am": 0,
-            "enable": 1
-        },
-        {
-            "rf_frequency_khz": 7380,
-            "rf_level": 100,
-            "input": "ADC2L",
-            "generator_ena": 0,
-            "generator_level": 2,
-            "preemphasis": "AUDIO_50US",
-            "fm_bandwidth": "BW_130",
-            "am": 0,
-            "enable": 1
-        },
-        {
-            "rf_frequency_khz": 7560,
-            "rf_level": 100,
-            "input": "ADC2R",
-            "generator_ena": 0,
-            "generator_level": 2,
-            "preemphasis": "AUDIO_50US",
-            "fm_bandwidth": "BW_130",
-            "am": 0,
-            "enable": 1
-        }
-        ]
-
-        for fm_ch in range(0, 4):
-            for key, value in settings[fm_ch].items():
-                self.assertEqual(self._system(f"baseband_config --usb_easymcp --set fm.{fm_ch}.{key}={value}"), 0,
-                                 f"Failed to set {key}={value} on FM channel {fm_ch}")
+        set_args = " ".join(f"--set fm.{fm_ch}.{key}={value}" for fm_ch, settings in enumerate(FM_CHANNEL_SETTINGS) for key, value in settings.items())
+        self.assertEqual(self._system(f"baseband_config --usb_easymcp {set_args}"), 0,
+                         f"Failed to set FM settings: {set_args}")
 
     def test_nicam(self):
         """
@@ -95,9 +60,9 @@ class TestCliSettings(unittest.TestCase):
             "nicam_bandwidth": "BW_700",
             "enable": 1
         }
-        for key, value in settings.items():
-            self.assertEqual(self._system(f"baseband_config --usb_easymcp --set nicam.{key}={value}"), 0,
-                             f"Failed to set {key}={value} on NICAM settings")
+        set_args = " ".join(f"--set nicam.{key}={value}" for key, value in settings.items())
+        self.assertEqual(self._system(f"baseband_config --usb_easymcp {set_args}"), 0,
+                         f"Failed to set NICAM settings: {set_args}")
 
     def test_video(self):
         """
@@ -114,9 +79,9 @@ class TestCliSettings(unittest.TestCase):
             "filter_bypass": 0,
             "enable": 1
         }
-        for key, value in settings.items():
-            self.assertEqual(self._system(f"baseband_config --usb_easymcp --set video.{key}={value}"), 0,
-                             f"Failed to set {key}={value} on VIDEO settings")
+        set_args = " ".join(f"--set video.{key}={value}" for key, value in settings.items())
+        self.assertEqual(self._system(f"baseband_config --usb_easymcp {set_args}"), 0,
+                         f"Failed to set VIDEO settings: {set_args}")
 
     def test_general(self):
         """
@@ -132,9 +97,9 @@ class TestCliSettings(unittest.TestCase):
             "morse_speed": 1,
             "morse_message_repeat_time": 10
         }
-        for key, value in settings.items():
-            self.assertEqual(self._system(f"baseband_config --usb_easymcp --set general.{key}={value}"), 0,
-                             f"Failed to set {key}={value} on GENERAL settings")
+        set_args = " ".join(f"--set general.{key}={value}" for key, value in settings.items())
+        self.assertEqual(self._system(f"baseband_config --usb_easymcp {set_args}"), 0,
+                         f"Failed to set GENERAL settings: {set_args}")
 
 
 if __name__ == '__main__':